@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the PyTorch DataLoader materializer."""
 
+import io
 import os
 from typing import Any, Type, cast
 
@@ -20,6 +21,7 @@ import torch
 from torch.utils.data.dataloader import DataLoader
 
 from zenml.artifacts import DataArtifact
+from zenml.integrations.pytorch.utils import save_to_file
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 
@@ -43,10 +45,18 @@ class PyTorchDataLoaderMaterializer(BaseMaterializer):
             A loaded PyTorch dataloader.
         """
         super().handle_input(data_type)
-        with fileio.open(
-            os.path.join(self.artifact.uri, DEFAULT_FILENAME), "rb"
-        ) as f:
-            return cast(DataLoader[Any], torch.load(f))  # type: ignore[no-untyped-call]  # noqa
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        with fileio.open(filepath, "rb") as f:
+            # Read the whole file into memory first: artifact stores backed
+            # by remote storage return streaming file objects for which the
+            # many small reads issued by `torch.load` are very slow.
+            buffer = io.BytesIO(f.read())
+        # Always load onto the CPU: dataloaders saved with CUDA tensors would
+        # otherwise fail to load on machines without a GPU.
+        return cast(
+            DataLoader[Any],
+            torch.load(buffer, map_location="cpu"),  # type: ignore[no-untyped-call]  # noqa
+        )
 
     def handle_return(self, dataloader: DataLoader[Any]) -> None:
         """Writes a PyTorch dataloader.
@@ -57,7 +67,5 @@ class PyTorchDataLoaderMaterializer(BaseMaterializer):
         super().handle_return(dataloader)
 
         # Save entire dataloader to artifact directory
-        with fileio.open(
-            os.path.join(self.artifact.uri, DEFAULT_FILENAME), "wb"
-        ) as f:
-            torch.save(dataloader, f)
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        save_to_file(dataloader, filepath)
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the PyTorch Module materializer."""
 
+import io
 import os
 from typing import Any, Type
 
@@ -20,6 +21,7 @@ import torch
 from torch.nn import Module  # type: ignore[attr-defined]
 
 from zenml.artifacts import ModelArtifact
+from zenml.integrations.pytorch.utils import save_to_file
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 
@@ -49,10 +51,11 @@ class PyTorchModuleMaterializer(BaseMaterializer):
             A loaded pytorch model.
         """
         super().handle_input(data_type)
-        with fileio.open(
-            os.path.join(self.artifact.uri, DEFAULT_FILENAME), "rb"
-        ) as f:
-            return torch.load(f)  # type: ignore[no-untyped-call]  # noqa
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        with fileio.open(filepath, "rb") as f:
+            # Buffer the contents to avoid many small reads on remote stores
+            buffer = io.BytesIO(f.read())
+        return torch.load(buffer)  # type: ignore[no-untyped-call]  # noqa
 
     def handle_return(self, model: Module) -> None:
         """Writes a PyTorch model, as a model and a checkpoint.
@@ -64,15 +67,12 @@ class PyTorchModuleMaterializer(BaseMaterializer):
 
         # Save entire model to artifact directory, This is the default behavior
         # for loading model in development phase (training, evaluation)
-        with fileio.open(
-            os.path.join(self.artifact.uri, DEFAULT_FILENAME), "wb"
-        ) as f:
-            torch.save(model, f)
+        save_to_file(model, os.path.join(self.artifact.uri, DEFAULT_FILENAME))
 
         # Also save model checkpoint to artifact directory,
         # This is the default behavior for loading model in production phase (inference)
         if isinstance(model, Module):
-            with fileio.open(
-                os.path.join(self.artifact.uri, CHECKPOINT_FILENAME), "wb"
-            ) as f:
-                torch.save(model.state_dict(), f)
+            save_to_file(
+                model.state_dict(),
+                os.path.join(self.artifact.uri, CHECKPOINT_FILENAME),
+            )
@@ -0,0 +1,39 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions for the PyTorch integration."""
+
+import os
+import tempfile
+from typing import Any
+
+import torch
+
+from zenml.io import fileio
+
+
+def save_to_file(obj: Any, filepath: str) -> None:
+    """Serializes an object with `torch.save` and writes it to a file.
+
+    The object is first saved to a local temporary file, which guarantees that
+    torch uses its zipfile based serialization format, and then copied to the
+    (potentially remote) destination in a single transfer.
+
+    Args:
+        obj: The object to serialize.
+        filepath: The path of the file to write.
+    """
+    with tempfile.TemporaryDirectory(prefix="zenml-temp-") as temp_dir:
+        temp_file = os.path.join(temp_dir, os.path.basename(filepath))
+        torch.save(obj, temp_file, _use_new_zipfile_serialization=True)
+        fileio.copy(temp_file, filepath, overwrite=True)
@@ -62,6 +62,19 @@ class CustomFormatter(logging.Formatter):
         LoggingLevels.CRITICAL: bold_red,
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the formatter and the per-level colored formatters.
+
+        Args:
+            args: Positional arguments passed to the base formatter.
+            kwargs: Keyword arguments passed to the base formatter.
+        """
+        super().__init__(*args, **kwargs)
+        self._level_formatters: Dict[LoggingLevels, logging.Formatter] = {
+            level: logging.Formatter(color + self.format_template + self.reset)
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
         """Converts a log record to a (colored) string.
 
@@ -71,12 +84,7 @@ class CustomFormatter(logging.Formatter):
         Returns:
             A string formatted according to specifications.
         """
-        log_fmt = (
-            self.COLORS[LoggingLevels(record.levelno)]
-            + self.format_template
-            + self.reset
-        )
-        formatter = logging.Formatter(log_fmt)
+        formatter = self._level_formatters[LoggingLevels(record.levelno)]
         formatted_message = formatter.format(record)
         quoted_groups = re.findall("`([^`]*)`", formatted_message)
         for quoted in quoted_groups:
@@ -92,6 +100,10 @@ class CustomFormatter(logging.Formatter):
 
 LOG_FILE = f"{APP_NAME}_logs.log"
 
+# Loggers that have already been configured by `get_logger`, indexed by name
+_loggers: Dict[str, logging.Logger] = {}
+_console_formatter = CustomFormatter()
+
 
 def get_logging_level() -> LoggingLevels:
     """Get logging level from the env variable.
@@ -134,19 +146,27 @@ def get_console_handler() -> Any:
         A console handler.
     """
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(CustomFormatter())
+    console_handler.setFormatter(_console_formatter)
     return console_handler
 
 
 def get_logger(logger_name: str) -> logging.Logger:
     """Main function to get logger name,.
 
+    Loggers are only configured the first time they are requested, later calls
+    with the same name return the cached logger instead of attaching another
+    console handler to it.
+
     Args:
         logger_name: Name of logger to initialize.
 
     Returns:
         A logger object.
     """
+    logger = _loggers.get(logger_name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(logger_name)
     logger.setLevel(get_logging_level().value)
     logger.addHandler(get_console_handler())
@@ -156,6 +176,7 @@ def get_logger(logger_name: str) -> logging.Logger:
     #  with this pattern, it's rarely necessary to propagate the error up to
     #  parent
     logger.propagate = False
+    _loggers[logger_name] = logger
     return logger
 
 
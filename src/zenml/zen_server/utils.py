@@ -15,10 +15,10 @@
 
 import os
 from functools import wraps
-from typing import Any, Callable, List, Optional, TypeVar, cast
+from typing import Any, Callable, List, Optional, TypeVar, Union, cast
 
 from fastapi import HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import ENV_ZENML_SERVER_ROOT_URL_PATH
@@ -59,30 +59,62 @@ def zen_store() -> BaseZenStore:
 def initialize_zen_store() -> None:
     """Initialize the ZenML Store.
 
+    The store is only initialized once per process. Subsequent calls, e.g.
+    triggered by additional startup events, reuse the existing store instead
+    of paying the cost of connecting to the store back-end again.
+
     Raises:
         ValueError: If the ZenML Store is using a REST back-end.
     """
     global _zen_store
 
-    logger.debug("Initializing ZenML Store for FastAPI...")
-    _zen_store = GlobalConfiguration().zen_store
+    if _zen_store is not None:
+        logger.debug("ZenML Store for FastAPI already initialized.")
+        return
 
-    # We override track_analytics=False because we do not
-    # want to track anything server side.
-    _zen_store.track_analytics = False
+    logger.debug("Initializing ZenML Store for FastAPI...")
+    store = GlobalConfiguration().zen_store
 
-    if _zen_store.type == StoreType.REST:
+    if store.type == StoreType.REST:
         raise ValueError(
             "Server cannot be started with a REST store type. Make sure you "
             "configure ZenML to use a non-networked store backend "
             "when trying to start the ZenML Server."
         )
 
+    # We override track_analytics=False because we do not
+    # want to track anything server side.
+    store.track_analytics = False
+
+    _zen_store = store
+
+
+class ValidationError(BaseModel):
+    """Details of a single request validation error.
+
+    FastAPI reports invalid requests with a 422 response whose `detail` is a
+    list of these objects. The model mirrors the `ValidationError` schema
+    that FastAPI adds to the OpenAPI spec, including its name, so that both
+    end up as the same schema.
+    """
+
+    loc: List[Union[str, int]] = Field(title="Location")
+    msg: str = Field(title="Message")
+    type: str = Field(title="Error Type")
+
 
 class ErrorModel(BaseModel):
     """Base class for error responses."""
 
-    detail: Any
+    detail: Union[List[str], List[ValidationError], str]
+
+    class Config:
+        """Pydantic configuration class."""
+
+        # Error models are never modified after creation
+        allow_mutation = False
+        # Forbid extra attributes set in the class.
+        extra = "forbid"
 
 
 error_response = dict(model=ErrorModel)
@@ -97,7 +129,7 @@ def error_detail(error: Exception) -> List[str]:
     Returns:
         List of strings representing the error.
     """
-    return [type(error).__name__] + [str(a) for a in error.args]
+    return [type(error).__name__, *map(str, error.args)]
 
 
 def not_authorized(error: Exception) -> HTTPException:
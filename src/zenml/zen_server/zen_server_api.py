@@ -17,10 +17,13 @@ from asyncio.log import logger
 from typing import Any, List
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from genericpath import isfile
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import FileResponse
 
 import zenml
@@ -62,6 +65,7 @@ app = FastAPI(
     title="ZenML",
     version=zenml.__version__,
     root_path=ROOT_URL_PATH,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -71,6 +75,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress larger responses (e.g. long resource lists) for clients that accept
+# gzip encoded responses
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 @app.on_event("startup")
@@ -81,6 +88,26 @@ def initialize() -> None:
     initialize_zen_store()
 
 
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> ORJSONResponse:
+    """Serializes HTTP error responses with orjson.
+
+    Args:
+        request: Request object.
+        exc: The HTTP exception to convert to a response.
+
+    Returns:
+        The error response.
+    """
+    return ORJSONResponse(
+        {"detail": exc.detail},
+        status_code=exc.status_code,
+        headers=getattr(exc, "headers", None),
+    )
+
+
 app.mount(
     "/static",
     StaticFiles(
@@ -93,7 +120,7 @@ app.mount(
 # Basic Health Endpoint
 @app.head(HEALTH, include_in_schema=False)
 @app.get(HEALTH)
-def health() -> str:
+async def health() -> str:
     """Get health status of the server.
 
     Returns:
@@ -13,26 +13,36 @@
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
 
+import base64
 import os
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
+    NoReturn,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 from uuid import UUID
 
+import orjson
 import requests
 import urllib3
 from pydantic import BaseModel, validator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from zenml import __version__
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
@@ -55,7 +65,7 @@ from zenml.constants import (
     USERS,
     VERSION_1,
 )
-from zenml.enums import StackComponentType, StoreType
+from zenml.enums import ExecutionStatus, StackComponentType, StoreType
 from zenml.exceptions import (
     AuthorizationException,
     DoesNotExistException,
@@ -131,7 +141,44 @@ AnyProjectScopedModel = TypeVar(
 )
 
 
+ALLOWED_URL_SCHEMES = ("https://", "http://")
 DEFAULT_HTTP_TIMEOUT = 30
+# Maximum number of keep-alive connections to the server kept in the pool
+DEFAULT_HTTP_POOL_MAXSIZE = 32
+# Retry policy for transient connection errors and gateway errors. Only
+# idempotent requests (i.e. not POST) are retried on a bad status code.
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_HTTP_RETRY_BACKOFF_FACTOR = 0.2
+DEFAULT_HTTP_RETRY_STATUS_CODES = (502, 503, 504)
+# Maximum number of requests sent to the server in parallel when fetching
+# several resources at once. Must not exceed the connection pool size.
+DEFAULT_HTTP_MAX_PARALLEL_REQUESTS = 8
+# Seconds before its expiration at which an authentication token is replaced
+AUTH_TOKEN_EXPIRATION_MARGIN = 30
+# Seconds for which the flavors listed by the server are cached locally
+FLAVOR_CACHE_TTL = 300
+# Seconds for which pipelines fetched from the server are cached locally
+PIPELINE_CACHE_TTL = 30
+# Maximum number of pipelines cached locally
+PIPELINE_CACHE_MAXSIZE = 256
+# Maximum number of finished step runs cached locally
+STEP_CACHE_MAXSIZE = 1024
+# Step statuses after which a step run is never modified again
+FINISHED_STEP_STATUSES = (
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.CACHED,
+    ExecutionStatus.FAILED,
+)
+# Headers sent along with the JSON encoded bodies of POST and PUT requests
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+# Exceptions raised for 409 Conflict responses, indexed by the exception type
+# name reported by the server
+CONFLICT_ERRORS: Dict[Optional[str], Type[EntityExistsError]] = {
+    "StackComponentExistsError": StackComponentExistsError,
+    "StackExistsError": StackExistsError,
+    "EntityExistsError": EntityExistsError,
+}
 
 
 class RestZenStoreConfiguration(StoreConfiguration):
@@ -166,10 +213,9 @@ class RestZenStoreConfiguration(StoreConfiguration):
             ValueError: If the URL is not a well formed REST store URL.
         """
         url = url.rstrip("/")
-        scheme = re.search("^([a-z0-9]+://)", url)
-        if scheme is None or scheme.group() not in ("https://", "http://"):
+        if not url.startswith(ALLOWED_URL_SCHEMES):
             raise ValueError(
-                "Invalid URL for REST store: {url}. Should be in the form "
+                f"Invalid URL for REST store: {url}. Should be in the form "
                 "https://hostname[:port] or http://hostname[:port]."
             )
 
@@ -266,6 +312,219 @@ class RestZenStoreConfiguration(StoreConfiguration):
         extra = "forbid"
 
 
+def _get_token_expiration(token: str) -> Optional[float]:
+    """Get the expiration time of a JWT token.
+
+    The token signature is not verified, the expiration time is only used to
+    replace the token before the server rejects it.
+
+    Args:
+        token: The JWT token.
+
+    Returns:
+        The expiration time as a UNIX timestamp, or None if the token doesn't
+        expire or can't be decoded.
+    """
+    try:
+        payload = token.split(".")[1]
+        # restore the base64 padding stripped from JWT segments
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _add_to_lru_cache(
+    cache: Dict[Any, Any], key: Any, value: Any, maxsize: int
+) -> None:
+    """Add an entry to a cache, evicting the least recently used entries.
+
+    Dictionaries preserve the insertion order of their keys, so the first key
+    of the cache is the least recently used one as long as entries are
+    re-inserted each time they are used.
+
+    Args:
+        cache: The cache to add the entry to.
+        key: The key of the entry.
+        value: The value of the entry.
+        maxsize: The maximum number of entries to keep in the cache.
+    """
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > maxsize:
+        del cache[next(iter(cache))]
+
+
+def _get_error_type(detail: Sequence[Any]) -> Optional[str]:
+    """Get the type of the exception that caused an error response.
+
+    The server reports the type name of the exception as the first element of
+    the error details.
+
+    Args:
+        detail: The error details of the response.
+
+    Returns:
+        The exception type name, if one was reported.
+    """
+    if isinstance(detail, list) and len(detail) > 0:
+        if isinstance(detail[0], str):
+            return detail[0]
+    return None
+
+
+def _format_error_detail(detail: Sequence[Any]) -> str:
+    """Format the error details of a response as an error message.
+
+    The details are either a single message, the exception type name and
+    arguments reported by the server, or the request validation errors
+    reported by FastAPI.
+
+    Args:
+        detail: The error details of the response.
+
+    Returns:
+        The error message.
+    """
+    if isinstance(detail, str):
+        return detail
+    messages = []
+    for item in detail:
+        if isinstance(item, dict) and "msg" in item:
+            location = ".".join(str(part) for part in item.get("loc", ()))
+            messages.append(f"{location}: {item['msg']}")
+        else:
+            messages.append(str(item))
+    return ": ".join(messages)
+
+
+def _raise_authorization_error(
+    response: requests.Response, detail: Sequence[Any]
+) -> NoReturn:
+    """Raise the exception for a 401 Unauthorized response.
+
+    Args:
+        response: The response to handle.
+        detail: The error details of the response.
+
+    Raises:
+        AuthorizationException: Always.
+    """
+    raise AuthorizationException(
+        f"{response.status_code} Client Error: Unauthorized request to "
+        f"URL {response.url}: {detail}"
+    )
+
+
+def _raise_not_found_error(
+    response: requests.Response, detail: Sequence[Any]
+) -> NoReturn:
+    """Raise the exception for a 404 Not Found response.
+
+    Args:
+        response: The response to handle.
+        detail: The error details of the response.
+
+    Raises:
+        KeyError: If the requested entity does not exist.
+        DoesNotExistException: If the requested endpoint does not exist.
+    """
+    error_type = _get_error_type(detail)
+    if error_type == "KeyError":
+        raise KeyError(detail[1])
+    elif error_type == "DoesNotExistException":
+        raise DoesNotExistException(_format_error_detail(detail))
+    raise DoesNotExistException("Endpoint does not exist.")
+
+
+def _raise_conflict_error(
+    response: requests.Response, detail: Sequence[Any]
+) -> NoReturn:
+    """Raise the exception for a 409 Conflict response.
+
+    # noqa: DAR401
+    # noqa: DAR402
+
+    Args:
+        response: The response to handle.
+        detail: The error details of the response.
+
+    Raises:
+        EntityExistsError: If the requested entity already exists.
+        StackComponentExistsError: If the requested stack component already
+            exists.
+        StackExistsError: If the requested stack already exists.
+        ValueError: For any other conflict.
+    """
+    conflict_error = CONFLICT_ERRORS.get(_get_error_type(detail))
+    if conflict_error is not None:
+        raise conflict_error(message=_format_error_detail(detail))
+    raise ValueError(_format_error_detail(detail))
+
+
+def _raise_unprocessable_error(
+    response: requests.Response, detail: Sequence[Any]
+) -> NoReturn:
+    """Raise the exception for a 422 Unprocessable Entity response.
+
+    Args:
+        response: The response to handle.
+        detail: The error details of the response.
+
+    Raises:
+        RuntimeError: Always.
+    """
+    raise RuntimeError(_format_error_detail(detail))
+
+
+def _raise_server_error(
+    response: requests.Response, detail: Sequence[Any]
+) -> NoReturn:
+    """Raise the exception for a 500 Internal Server Error response.
+
+    Args:
+        response: The response to handle.
+        detail: The error details of the response.
+
+    Raises:
+        RuntimeError: Always.
+    """
+    raise RuntimeError(response.text)
+
+
+def _raise_unexpected_response_error(
+    response: requests.Response, detail: Sequence[Any]
+) -> NoReturn:
+    """Raise the exception for a response with any other error status code.
+
+    Args:
+        response: The response to handle.
+        detail: The error details of the response.
+
+    Raises:
+        RuntimeError: Always.
+    """
+    raise RuntimeError(
+        "Error retrieving from API. Got response "
+        f"{response.status_code} with body:\n{response.text}"
+    )
+
+
+# Functions raising the exception for an error response, indexed by the
+# HTTP status code of the response
+ERROR_RESPONSE_HANDLERS: Dict[
+    int, Callable[[requests.Response, Sequence[Any]], NoReturn]
+] = {
+    401: _raise_authorization_error,
+    404: _raise_not_found_error,
+    409: _raise_conflict_error,
+    422: _raise_unprocessable_error,
+    500: _raise_server_error,
+}
+
+
 class RestZenStore(BaseZenStore):
     """Store implementation for accessing data from a REST API."""
 
@@ -273,7 +532,20 @@ class RestZenStore(BaseZenStore):
     TYPE: ClassVar[StoreType] = StoreType.REST
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
+    _api_token_expiration: Optional[float] = None
     _session: Optional[requests.Session] = None
+    _api_url: Optional[str] = None
+    # cached flavor listings, indexed by the list filters, together with the
+    # time at which they were fetched
+    _flavor_cache: Dict[Tuple[Any, ...], Tuple[float, List[FlavorModel]]] = {}
+    # pipelines fetched by ID, together with the time at which they were
+    # fetched, ordered from the least to the most recently used one
+    _pipeline_cache: Dict[UUID, Tuple[float, PipelineModel]] = {}
+    # step runs that have finished executing, indexed by their ID and ordered
+    # from the least to the most recently used one
+    _finished_step_cache: Dict[UUID, StepRunModel] = {}
+    # the metadata config doesn't change while the server is running
+    _metadata_config: Optional[str] = None
 
     def _initialize_database(self) -> None:
         """Initialize the database."""
@@ -290,6 +562,7 @@ class RestZenStore(BaseZenStore):
     def _initialize(self) -> None:
         """Initialize the REST store."""
         # try to connect to the server to validate the configuration
+        logger.debug("Connecting to ZenML server at %s...", self.url)
         self.active_user
 
     def get_store_info(self) -> ServerModel:
@@ -328,11 +601,16 @@ class RestZenStore(BaseZenStore):
 
         from zenml.zen_stores.sql_zen_store import SqlZenStoreConfiguration
 
-        body = self.get(f"{METADATA_CONFIG}")
-        if not isinstance(body, str):
-            raise ValueError(
-                f"Invalid response from server: {body}. Expected string."
-            )
+        if self._metadata_config is None:
+            body = self.get(f"{METADATA_CONFIG}")
+            if not isinstance(body, str):
+                raise ValueError(
+                    f"Invalid response from server: {body}. Expected string."
+                )
+            self._metadata_config = body
+        # the config is parsed on every call because the returned protobuf
+        # messages are mutable
+        body = self._metadata_config
 
         # First try to parse the response as a ConnectionConfig, then as a
         # MetadataStoreClientConfig.
@@ -636,6 +914,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The newly created flavor.
         """
+        self._flavor_cache.clear()
         return self._create_project_scoped_resource(
             resource=flavor,
             route=FLAVORS,
@@ -668,6 +947,11 @@ class RestZenStore(BaseZenStore):
     ) -> List[FlavorModel]:
         """List all stack component flavors matching the given filter criteria.
 
+        Flavors rarely change, so the listings are cached for
+        `FLAVOR_CACHE_TTL` seconds. The cache is cleared whenever a flavor is
+        created, updated or deleted through this store. Copies of the cached
+        flavors are returned so that callers can't modify the cache.
+
         Args:
             project_name_or_id: Optionally filter by the Project to which the
                 component flavors belong
@@ -680,13 +964,25 @@ class RestZenStore(BaseZenStore):
         Returns:
             List of all the stack component flavors matching the given criteria.
         """
-        filters = locals()
-        filters.pop("self")
-        return self._list_resources(
+        filters: Dict[str, Any] = {
+            "project_name_or_id": project_name_or_id,
+            "user_name_or_id": user_name_or_id,
+            "component_type": component_type,
+            "name": name,
+            "is_shared": is_shared,
+        }
+        cache_key = tuple(sorted(filters.items()))
+        cached = self._flavor_cache.get(cache_key)
+        if cached is not None and time.time() - cached[0] < FLAVOR_CACHE_TTL:
+            return [flavor.copy(deep=True) for flavor in cached[1]]
+
+        flavors = self._list_resources(
             route=FLAVORS,
             resource_model=FlavorModel,
             **filters,
         )
+        self._flavor_cache[cache_key] = (time.time(), flavors)
+        return [flavor.copy(deep=True) for flavor in flavors]
 
     @track(AnalyticsEvent.UPDATED_FLAVOR)
     def update_flavor(self, flavor: FlavorModel) -> FlavorModel:
@@ -698,6 +994,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated stack component flavor.
         """
+        self._flavor_cache.clear()
         return self._update_resource(
             resource=flavor,
             route=FLAVORS,
@@ -712,6 +1009,7 @@ class RestZenStore(BaseZenStore):
         Args:
             flavor_id: The ID of the stack component flavor to delete.
         """
+        self._flavor_cache.clear()
         self._delete_resource(
             resource_id=flavor_id,
             route=FLAVORS,
@@ -825,7 +1123,7 @@ class RestZenStore(BaseZenStore):
         request = EmailOptInModel(
             email=email, email_opted_in=user_opt_in_response
         )
-        route = f"{USERS}/{str(user_name_or_id)}{EMAIL_ANALYTICS}"
+        route = f"{USERS}/{user_name_or_id}{EMAIL_ANALYTICS}"
 
         response_body = self.put(route, body=request)
         user = UserModel.parse_obj(response_body)
@@ -1057,23 +1355,20 @@ class RestZenStore(BaseZenStore):
         Returns:
             A list of all role assignments.
         """
-        roles: List[RoleAssignmentModel] = []
+        routes: List[str] = []
         if user_name_or_id:
-            roles.extend(
-                self._list_resources(
-                    route=f"{USERS}/{user_name_or_id}{ROLES}",
-                    resource_model=RoleAssignmentModel,
-                    project_name_or_id=project_name_or_id,
-                )
-            )
+            routes.append(f"{USERS}/{user_name_or_id}{ROLES}")
         if team_name_or_id:
-            roles.extend(
-                self._list_resources(
-                    route=f"{TEAMS}/{team_name_or_id}{ROLES}",
-                    resource_model=RoleAssignmentModel,
-                    project_name_or_id=project_name_or_id,
-                )
-            )
+            routes.append(f"{TEAMS}/{team_name_or_id}{ROLES}")
+
+        params: Dict[str, Any] = {}
+        if project_name_or_id is not None:
+            params["project_name_or_id"] = project_name_or_id
+
+        # fetch the user and team role assignments in parallel
+        roles: List[RoleAssignmentModel] = []
+        for body in self._get_many(routes, params=params):
+            roles.extend(self._parse_resource_list(body, RoleAssignmentModel))
         return roles
 
     def assign_role(
@@ -1215,17 +1510,39 @@ class RestZenStore(BaseZenStore):
     def get_pipeline(self, pipeline_id: UUID) -> PipelineModel:
         """Get a pipeline with a given ID.
 
+        Pipelines are cached for `PIPELINE_CACHE_TTL` seconds. The cache
+        entry is dropped when it expires or when the pipeline is updated or
+        deleted through this store, and only the `PIPELINE_CACHE_MAXSIZE`
+        most recently used pipelines are kept in the cache.
+
         Args:
             pipeline_id: ID of the pipeline.
 
         Returns:
             The pipeline.
         """
-        return self._get_resource(
+        cached = self._pipeline_cache.pop(pipeline_id, None)
+        if cached is not None and time.time() - cached[0] < PIPELINE_CACHE_TTL:
+            _add_to_lru_cache(
+                self._pipeline_cache,
+                pipeline_id,
+                cached,
+                PIPELINE_CACHE_MAXSIZE,
+            )
+            return cached[1].copy(deep=True)
+
+        pipeline = self._get_resource(
             resource_id=pipeline_id,
             route=PIPELINES,
             resource_model=PipelineModel,
         )
+        _add_to_lru_cache(
+            self._pipeline_cache,
+            pipeline_id,
+            (time.time(), pipeline),
+            PIPELINE_CACHE_MAXSIZE,
+        )
+        return pipeline.copy(deep=True)
 
     def list_pipelines(
         self,
@@ -1261,6 +1578,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated pipeline.
         """
+        self._pipeline_cache.pop(pipeline.id, None)
         return self._update_resource(
             resource=pipeline,
             route=PIPELINES,
@@ -1274,6 +1592,7 @@ class RestZenStore(BaseZenStore):
         Args:
             pipeline_id: The ID of the pipeline to delete.
         """
+        self._pipeline_cache.pop(pipeline_id, None)
         self._delete_resource(
             resource_id=pipeline_id,
             route=PIPELINES,
@@ -1394,17 +1713,36 @@ class RestZenStore(BaseZenStore):
     def get_run_step(self, step_id: UUID) -> StepRunModel:
         """Get a step by ID.
 
+        Steps that have finished executing don't change anymore, so they are
+        only fetched from the server once. The `STEP_CACHE_MAXSIZE` most
+        recently used finished steps are kept in the cache.
+
         Args:
             step_id: The ID of the step to get.
 
         Returns:
             The step.
         """
-        return self._get_resource(
+        cached = self._finished_step_cache.get(step_id)
+        if cached is not None:
+            _add_to_lru_cache(
+                self._finished_step_cache, step_id, cached, STEP_CACHE_MAXSIZE
+            )
+            return cached.copy(deep=True)
+
+        step = self._get_resource(
             resource_id=step_id,
             route=STEPS,
             resource_model=StepRunModel,
         )
+        if step.status in FINISHED_STEP_STATUSES:
+            _add_to_lru_cache(
+                self._finished_step_cache,
+                step_id,
+                step.copy(deep=True),
+                STEP_CACHE_MAXSIZE,
+            )
+        return step
 
     def list_run_steps(
         self, run_id: Optional[UUID] = None
@@ -1434,6 +1772,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated step.
         """
+        self._finished_step_cache.pop(step.id, None)
         return self._update_resource(
             resource=step,
             route=STEPS,
@@ -1451,7 +1790,7 @@ class RestZenStore(BaseZenStore):
         Raises:
             ValueError: if the response from the API is not a dict.
         """
-        body = self.get(f"{STEPS}/{str(step_id)}{INPUTS}")
+        body = self.get(f"{STEPS}/{step_id}{INPUTS}")
         if not isinstance(body, dict):
             raise ValueError(
                 f"Bad API Response. Expected dict, got {type(body)}"
@@ -1516,9 +1855,11 @@ class RestZenStore(BaseZenStore):
             ValueError: if the response from the server isn't in the right format.
         """
         if self._api_token is None:
+            if self._session is None:
+                self._session = self._create_session()
             response = self._handle_response(
-                requests.post(
-                    self.url + API + VERSION_1 + LOGIN,
+                self._session.post(
+                    self.api_url + LOGIN,
                     data={
                         "username": self.config.username,
                         "password": self.config.password,
@@ -1533,8 +1874,82 @@ class RestZenStore(BaseZenStore):
                     f"{type(response)}"
                 )
             self._api_token = response["access_token"]
+            self._api_token_expiration = _get_token_expiration(self._api_token)
         return self._api_token
 
+    def _create_session(self) -> requests.Session:
+        """Create the (unauthenticated) HTTP session used to talk to the server.
+
+        The session keeps a pool of persistent keep-alive connections that is
+        reused by all requests sent to the server, including the login
+        requests.
+
+        Returns:
+            A new requests session.
+        """
+        if self.config.verify_ssl is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        session = requests.Session()
+        session.verify = self.config.verify_ssl
+        # accept all response encodings that urllib3 is able to decode, which
+        # includes brotli if the `brotli` package is installed
+        session.headers.update(urllib3.util.make_headers(accept_encoding=True))
+        session.headers.update(
+            {
+                "Accept": "application/json",
+                "User-Agent": f"zenml/{__version__}",
+            }
+        )
+        retries = Retry(
+            total=DEFAULT_HTTP_RETRIES,
+            backoff_factor=DEFAULT_HTTP_RETRY_BACKOFF_FACTOR,
+            status_forcelist=DEFAULT_HTTP_RETRY_STATUS_CODES,
+            # a read error means that the server may already have processed
+            # the request, so it is re-raised right away instead of retrying.
+            # Only connection errors and the gateway errors above are retried
+            read=False,
+            # return the last response instead of raising an exception so that
+            # it gets translated into the appropriate error
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=DEFAULT_HTTP_POOL_MAXSIZE,
+            max_retries=retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _reset_auth_token(self) -> None:
+        """Discard the authentication token used by the session.
+
+        Only the authentication header of the session is removed, the session
+        itself and its pool of connections are kept.
+        """
+        self._api_token = None
+        self._api_token_expiration = None
+        if self._session is not None:
+            self._session.headers.pop("Authorization", None)
+
+    def _refresh_token(self) -> None:
+        """Refresh the authentication token used by the session."""
+        self._reset_auth_token()
+        # accessing the session authenticates it again
+        self.session
+
+    @property
+    def api_url(self) -> str:
+        """The versioned API base URL of the server.
+
+        Returns:
+            The API base URL, to which endpoint paths are appended.
+        """
+        if self._api_url is None:
+            self._api_url = self.url + API + VERSION_1
+        return self._api_url
+
     @property
     def session(self) -> requests.Session:
         """Authenticate to the ZenML server.
@@ -1543,21 +1958,27 @@ class RestZenStore(BaseZenStore):
             A requests session with the authentication token.
         """
         if self._session is None:
-            if self.config.verify_ssl is False:
-                urllib3.disable_warnings(
-                    urllib3.exceptions.InsecureRequestWarning
-                )
-
-            self._session = requests.Session()
-            self._session.verify = self.config.verify_ssl
+            self._session = self._create_session()
+        if (
+            self._api_token_expiration is not None
+            and time.time()
+            > self._api_token_expiration - AUTH_TOKEN_EXPIRATION_MARGIN
+        ):
+            # replace the token before it expires instead of waiting for the
+            # server to reject a request
+            logger.debug("Authentication token expires soon, refreshing.")
+            self._reset_auth_token()
+        if self._api_token is None:
             token = self._get_auth_token()
-            self._session.headers.update({"Authorization": "Bearer " + token})
+            self._session.headers["Authorization"] = f"Bearer {token}"
             logger.debug("Authenticated to ZenML server.")
         return self._session
 
     def _handle_response(self, response: requests.Response) -> Json:
         """Handle API response, translating http status codes to Exception.
 
+        # noqa: DAR402
+
         Args:
             response: The response to handle.
 
@@ -1582,65 +2003,31 @@ class RestZenStore(BaseZenStore):
             ValueError: If the response indicates that the requested entity
                 does not exist.
         """
-        if response.status_code >= 200 and response.status_code < 300:
+        if 200 <= response.status_code < 300:
             try:
-                payload: Json = response.json()
+                payload: Json = orjson.loads(response.content)
                 return payload
-            except requests.exceptions.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 raise ValueError(
                     "Bad response from API. Expected json, got\n"
                     f"{response.text}"
                 )
-        elif response.status_code == 401:
-            raise AuthorizationException(
-                f"{response.status_code} Client Error: Unauthorized request to "
-                f"URL {response.url}: {response.json().get('detail')}"
-            )
-        elif response.status_code == 404:
-            if "KeyError" in response.text:
-                raise KeyError(
-                    response.json().get("detail", (response.text,))[1]
-                )
-            elif "DoesNotExistException" in response.text:
-                message = ": ".join(
-                    response.json().get("detail", (response.text,))
-                )
-                raise DoesNotExistException(message)
-            raise DoesNotExistException("Endpoint does not exist.")
-        elif response.status_code == 409:
-            if "StackComponentExistsError" in response.text:
-                raise StackComponentExistsError(
-                    message=": ".join(
-                        response.json().get("detail", (response.text,))
-                    )
-                )
-            elif "StackExistsError" in response.text:
-                raise StackExistsError(
-                    message=": ".join(
-                        response.json().get("detail", (response.text,))
-                    )
-                )
-            elif "EntityExistsError" in response.text:
-                raise EntityExistsError(
-                    message=": ".join(
-                        response.json().get("detail", (response.text,))
-                    )
-                )
-            else:
-                raise ValueError(
-                    ": ".join(response.json().get("detail", (response.text,)))
-                )
-        elif response.status_code == 422:
-            raise RuntimeError(
-                ": ".join(response.json().get("detail", (response.text,)))
-            )
-        elif response.status_code == 500:
-            raise RuntimeError(response.text)
-        else:
-            raise RuntimeError(
-                "Error retrieving from API. Got response "
-                f"{response.status_code} with body:\n{response.text}"
-            )
+
+        # Parse the error response only once and reuse the error details
+        try:
+            body = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            body = None
+        detail = (
+            body.get("detail", (response.text,))
+            if isinstance(body, dict)
+            else (response.text,)
+        )
+
+        handler = ERROR_RESPONSE_HANDLERS.get(
+            response.status_code, _raise_unexpected_response_error
+        )
+        handler(response, detail)
 
     def _request(
         self,
@@ -1675,7 +2062,7 @@ class RestZenStore(BaseZenStore):
         except AuthorizationException:
             # The authentication token could have expired; refresh it and try
             # again
-            self._session = None
+            self._refresh_token()
             return self._handle_response(
                 self.session.request(
                     method,
@@ -1687,6 +2074,22 @@ class RestZenStore(BaseZenStore):
                 )
             )
 
+    @staticmethod
+    def _serialize_body(body: BaseModel) -> bytes:
+        """Serialize a request body to JSON.
+
+        Update requests are only applied for the fields that are not None,
+        so those fields are left out of the serialized body.
+
+        Args:
+            body: The body to serialize.
+
+        Returns:
+            The UTF-8 encoded JSON body.
+        """
+        exclude_none = isinstance(body, UpdateRequest)
+        return body.json(exclude_none=exclude_none).encode("utf-8")
+
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> Json:
@@ -1700,9 +2103,9 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        logger.debug(f"Sending GET request to {path}...")
+        logger.debug("Sending GET request to %s...", path)
         return self._request(
-            "GET", self.url + API + VERSION_1 + path, params=params, **kwargs
+            "GET", self.api_url + path, params=params, **kwargs
         )
 
     def delete(
@@ -1718,9 +2121,9 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        logger.debug(f"Sending DELETE request to {path}...")
+        logger.debug("Sending DELETE request to %s...", path)
         return self._request(
-            "DELETE", self.url + API + VERSION_1 + path, params=params, **kwargs
+            "DELETE", self.api_url + path, params=params, **kwargs
         )
 
     def post(
@@ -1741,11 +2144,12 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        logger.debug(f"Sending POST request to {path}...")
+        logger.debug("Sending POST request to %s...", path)
         return self._request(
             "POST",
-            self.url + API + VERSION_1 + path,
-            data=body.json(),
+            self.api_url + path,
+            data=self._serialize_body(body),
+            headers=JSON_CONTENT_HEADERS,
             params=params,
             **kwargs,
         )
@@ -1768,15 +2172,44 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        logger.debug(f"Sending PUT request to {path}...")
+        logger.debug("Sending PUT request to %s...", path)
         return self._request(
             "PUT",
-            self.url + API + VERSION_1 + path,
-            data=body.json(),
+            self.api_url + path,
+            data=self._serialize_body(body),
+            headers=JSON_CONTENT_HEADERS,
             params=params,
             **kwargs,
         )
 
+    def _get_many(
+        self, paths: List[str], params: Optional[Dict[str, Any]] = None
+    ) -> List[Json]:
+        """Make GET requests to several endpoint paths in parallel.
+
+        The requests share the connection pool of the session, so fetching N
+        resources costs roughly one round-trip instead of N.
+
+        Args:
+            paths: The paths to the endpoints.
+            params: The query parameters to pass to every endpoint.
+
+        Returns:
+            The response bodies, in the same order as the paths.
+        """
+        if len(paths) <= 1:
+            return [self.get(path, params=params) for path in paths]
+
+        # authenticate before fanning out, so that the worker threads don't
+        # all try to log in at the same time
+        self.session
+        with ThreadPoolExecutor(
+            max_workers=min(len(paths), DEFAULT_HTTP_MAX_PARALLEL_REQUESTS)
+        ) as executor:
+            return list(
+                executor.map(lambda path: self.get(path, params=params), paths)
+            )
+
     def _create_resource(
         self,
         resource: AnyModel,
@@ -1834,7 +2267,7 @@ class RestZenStore(BaseZenStore):
         """
         return self._create_resource(
             resource=resource,
-            route=f"{PROJECTS}/{str(resource.project)}{route}",
+            route=f"{PROJECTS}/{resource.project}{route}",
             request_model=request_model,
             response_model=response_model,
         )
@@ -1855,7 +2288,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The retrieved resource.
         """
-        body = self.get(f"{route}/{str(resource_id)}")
+        body = self.get(f"{route}/{resource_id}")
         return resource_model.parse_obj(body)
 
     def _list_resources(
@@ -1873,13 +2306,28 @@ class RestZenStore(BaseZenStore):
 
         Returns:
             List of retrieved resources matching the filter criteria.
-
-        Raises:
-            ValueError: If the value returned by the server is not a list.
         """
         # leave out filter params that are not supplied
         params = dict(filter(lambda x: x[1] is not None, filters.items()))
         body = self.get(f"{route}", params=params)
+        return self._parse_resource_list(body, resource_model)
+
+    @staticmethod
+    def _parse_resource_list(
+        body: Json, resource_model: Type[AnyModel]
+    ) -> List[AnyModel]:
+        """Parse the body of a list response into resource models.
+
+        Args:
+            body: The response body.
+            resource_model: Model to use to serialize the response body.
+
+        Returns:
+            List of parsed resources.
+
+        Raises:
+            ValueError: If the value returned by the server is not a list.
+        """
         if not isinstance(body, list):
             raise ValueError(
                 f"Bad API Response. Expected list, got {type(body)}"
@@ -1909,7 +2357,7 @@ class RestZenStore(BaseZenStore):
         request: BaseModel = resource
         if request_model is not None:
             request = request_model.from_model(resource)
-        response_body = self.put(f"{route}/{str(resource.id)}", body=request)
+        response_body = self.put(f"{route}/{resource.id}", body=request)
         if response_model is not None:
             response = response_model.parse_obj(response_body)
             updated_resource = response.to_model()
@@ -1927,7 +2375,7 @@ class RestZenStore(BaseZenStore):
             resource_id: The ID of the resource to delete.
             route: The resource REST API route to use.
         """
-        self.delete(f"{route}/{str(resource_id)}")
+        self.delete(f"{route}/{resource_id}")
 
     def _sync_runs(self) -> None:
         """Syncs runs from MLMD.
@@ -17,7 +17,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.enums import StackComponentType
@@ -43,6 +43,17 @@ class FlavorSchema(SQLModel, table=True):
         updated: The last update time of the flavor.
     """
 
+    # flavors are looked up by project, type and name. Being the leading
+    # column, the project foreign key is covered by this index as well.
+    __table_args__ = (
+        Index(
+            "ix_flavorschema_project_id_type_name",
+            "project_id",
+            "type",
+            "name",
+        ),
+    )
+
     id: UUID = Field(primary_key=True)
     type: StackComponentType
     source: str
@@ -56,7 +67,9 @@ class FlavorSchema(SQLModel, table=True):
     project: "ProjectSchema" = Relationship(back_populates="flavors")
 
     user_id: UUID = Field(
-        sa_column=Column(ForeignKey("userschema.id", ondelete="SET NULL"))
+        sa_column=Column(
+            ForeignKey("userschema.id", ondelete="SET NULL"), index=True
+        )
     )
     user: "UserSchema" = Relationship(back_populates="flavors")
 
@@ -88,14 +101,19 @@ class FlavorSchema(SQLModel, table=True):
         self,
         flavor: FlavorModel,
     ) -> "FlavorSchema":
-        """Returns a flavor schema from a flavor model.
+        """Update the updatable fields on an existing `FlavorSchema`.
 
         Args:
-            flavor: The flavor model.
+            flavor: The flavor model to update the schema from.
 
         Returns:
-            The flavor schema.
+            The updated `FlavorSchema`.
         """
+        self.name = flavor.name
+        self.source = flavor.source
+        self.config_schema = flavor.config_schema
+        self.integration = flavor.integration
+        self.updated = datetime.now()
         return self
 
     def to_model(self) -> FlavorModel:
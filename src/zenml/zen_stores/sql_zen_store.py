@@ -1546,6 +1546,11 @@ class SqlZenStore(BaseZenStore):
 
         Raises:
             KeyError: if the flavor doesn't exist.
+            EntityExistsError: if the flavor is renamed and a flavor with the
+                new name and the same type is already owned by the same user in
+                the same project.
+            IllegalOperationError: if the flavor is renamed while it is still
+                used by stack components.
         """
         with Session(self.engine) as session:
             existing_flavor = session.exec(
@@ -1558,11 +1563,48 @@ class SqlZenStore(BaseZenStore):
                     f"existing component with this id."
                 )
 
+            # In case of a renaming update, make sure no flavor with the same
+            # domain key (name, type, project, owner) already exists and that
+            # no stack component refers to the flavor by its old name
+            if existing_flavor.name != flavor.name:
+                flavor_with_name = session.exec(
+                    select(FlavorSchema)
+                    .where(FlavorSchema.name == flavor.name)
+                    .where(FlavorSchema.type == existing_flavor.type)
+                    .where(
+                        FlavorSchema.project_id == existing_flavor.project_id
+                    )
+                    .where(FlavorSchema.user_id == existing_flavor.user_id)
+                ).first()
+                if flavor_with_name is not None:
+                    flavor_type = StackComponentType(existing_flavor.type)
+                    raise EntityExistsError(
+                        f"Unable to rename '{flavor_type.value}' "
+                        f"flavor '{existing_flavor.name}' to '{flavor.name}': "
+                        f"Found an existing flavor with the same name and type "
+                        f"in the same '{existing_flavor.project_id}' project "
+                        f"owned by the same '{existing_flavor.user_id}' user."
+                    )
+
+                components_of_flavor = session.exec(
+                    select(StackComponentSchema)
+                    .where(StackComponentSchema.flavor == existing_flavor.name)
+                    .where(StackComponentSchema.type == existing_flavor.type)
+                ).all()
+                if len(components_of_flavor) > 0:
+                    raise IllegalOperationError(
+                        f"Flavor `{existing_flavor.name}` of type "
+                        f"`{existing_flavor.type}` can not be renamed as it is "
+                        f"used by {len(components_of_flavor)} components. "
+                        f"Before renaming this flavor, make sure to delete "
+                        f"all associated components."
+                    )
+
             existing_flavor.from_update_model(flavor=flavor)
             session.add(existing_flavor)
             session.commit()
 
-        return existing_flavor.to_model()
+            return existing_flavor.to_model()
 
     @track(AnalyticsEvent.DELETED_FLAVOR)
     def delete_flavor(self, flavor_id: UUID) -> None:
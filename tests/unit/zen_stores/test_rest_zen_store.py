@@ -0,0 +1,513 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import base64
+import json
+import socket
+import threading
+from uuid import uuid4
+
+import pytest
+import requests
+from pydantic import ValidationError
+
+from zenml.config.pipeline_configurations import PipelineSpec
+from zenml.enums import ExecutionStatus, StackComponentType
+from zenml.exceptions import (
+    AuthorizationException,
+    DoesNotExistException,
+    EntityExistsError,
+    StackComponentExistsError,
+    StackExistsError,
+)
+from zenml.models import FlavorModel, PipelineModel, StepRunModel
+from zenml.zen_stores import rest_zen_store
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+    _get_token_expiration,
+)
+
+
+@pytest.fixture
+def rest_store(mocker) -> RestZenStore:
+    """Fixture for a REST store which doesn't connect to a server."""
+    mocker.patch.object(RestZenStore, "_initialize")
+    return RestZenStore(
+        config=RestZenStoreConfiguration(
+            url="http://localhost:8080", username="default"
+        ),
+        track_analytics=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "url", ["http://localhost:8080", "https://zenml.example.com/"]
+)
+def test_rest_store_config_accepts_http_urls(url: str):
+    """Tests that HTTP(S) URLs are accepted and stripped of trailing slashes."""
+    config = RestZenStoreConfiguration(url=url, username="default")
+    assert config.url == url.rstrip("/")
+
+
+@pytest.mark.parametrize(
+    "url", ["localhost:8080", "ftp://zenml.example.com", "sqlite:///zenml.db"]
+)
+def test_rest_store_config_rejects_non_http_urls(url: str):
+    """Tests that URLs without an HTTP(S) scheme are rejected."""
+    with pytest.raises(ValidationError):
+        RestZenStoreConfiguration(url=url, username="default")
+
+
+def _encode_jwt_segment(data: dict) -> str:
+    """Encodes a JWT segment without base64 padding."""
+    return (
+        base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    )
+
+
+def test_token_expiration_is_read_from_jwt_claims():
+    """Tests that the expiration time is read from the JWT `exp` claim."""
+    header = _encode_jwt_segment({"alg": "HS256", "typ": "JWT"})
+    token = f"{header}.{_encode_jwt_segment({'sub': 'x', 'exp': 1234})}.sig"
+    assert _get_token_expiration(token) == 1234.0
+
+    token = f"{header}.{_encode_jwt_segment({'sub': 'x'})}.sig"
+    assert _get_token_expiration(token) is None
+
+
+@pytest.mark.parametrize("token", ["", "not-a-jwt", "a.b!@#.c"])
+def test_token_expiration_of_malformed_tokens_is_none(token: str):
+    """Tests that malformed tokens are treated as not expiring."""
+    assert _get_token_expiration(token) is None
+
+
+def _create_step(status: ExecutionStatus) -> StepRunModel:
+    """Creates a step run model with the given status."""
+    return StepRunModel(
+        name="step",
+        pipeline_run_id=uuid4(),
+        parent_step_ids=[],
+        input_artifacts={},
+        status=status,
+        entrypoint_name="step",
+        parameters={},
+        step_configuration={},
+        mlmd_parent_step_ids=[],
+    )
+
+
+def test_finished_steps_are_only_fetched_once(rest_store, mocker):
+    """Tests that finished steps are cached and returned as copies."""
+    step = _create_step(ExecutionStatus.COMPLETED)
+    mock_get = mocker.patch.object(
+        RestZenStore, "_get_resource", return_value=step
+    )
+
+    first = rest_store.get_run_step(step.id)
+    first.parameters["key"] = "value"
+    second = rest_store.get_run_step(step.id)
+
+    assert mock_get.call_count == 1
+    assert second == step
+    assert second.parameters == {}
+
+
+def test_running_steps_are_not_cached(rest_store, mocker):
+    """Tests that steps which may still change are always fetched."""
+    step = _create_step(ExecutionStatus.RUNNING)
+    mock_get = mocker.patch.object(
+        RestZenStore, "_get_resource", return_value=step
+    )
+
+    rest_store.get_run_step(step.id)
+    rest_store.get_run_step(step.id)
+
+    assert mock_get.call_count == 2
+
+
+def test_updating_step_invalidates_cached_step(rest_store, mocker):
+    """Tests that updating a step drops it from the cache."""
+    step = _create_step(ExecutionStatus.COMPLETED)
+    mock_get = mocker.patch.object(
+        RestZenStore, "_get_resource", return_value=step
+    )
+    mocker.patch.object(RestZenStore, "_update_resource", return_value=step)
+
+    rest_store.get_run_step(step.id)
+    rest_store.update_run_step(step)
+    rest_store.get_run_step(step.id)
+
+    assert mock_get.call_count == 2
+
+
+def test_step_cache_evicts_least_recently_used_steps(rest_store, mocker):
+    """Tests that the step cache is bounded by `STEP_CACHE_MAXSIZE`."""
+    mocker.patch.object(rest_zen_store, "STEP_CACHE_MAXSIZE", 2)
+    steps = {
+        step.id: step
+        for step in (_create_step(ExecutionStatus.COMPLETED) for _ in range(3))
+    }
+    mock_get = mocker.patch.object(
+        RestZenStore,
+        "_get_resource",
+        side_effect=lambda resource_id, **kwargs: steps[resource_id],
+    )
+    first, second, third = steps
+
+    rest_store.get_run_step(first)
+    rest_store.get_run_step(second)
+    # using the first step makes the second one the least recently used one
+    rest_store.get_run_step(first)
+    rest_store.get_run_step(third)
+    assert mock_get.call_count == 3
+
+    rest_store.get_run_step(first)
+    assert mock_get.call_count == 3
+    rest_store.get_run_step(second)
+    assert mock_get.call_count == 4
+
+
+def _create_pipeline() -> PipelineModel:
+    """Creates a pipeline model."""
+    return PipelineModel(
+        name="pipeline",
+        docstring=None,
+        spec=PipelineSpec(steps=[]),
+        user=uuid4(),
+        project=uuid4(),
+    )
+
+
+def test_pipelines_are_cached_until_they_expire(rest_store, mocker):
+    """Tests that pipelines are fetched again once their cache entry expired."""
+    pipeline = _create_pipeline()
+    mock_get = mocker.patch.object(
+        RestZenStore, "_get_resource", return_value=pipeline
+    )
+    mock_time = mocker.patch("time.time", return_value=1000.0)
+
+    rest_store.get_pipeline(pipeline.id)
+    mock_time.return_value += rest_zen_store.PIPELINE_CACHE_TTL - 1
+    rest_store.get_pipeline(pipeline.id)
+    assert mock_get.call_count == 1
+
+    mock_time.return_value += 1
+    rest_store.get_pipeline(pipeline.id)
+    assert mock_get.call_count == 2
+
+
+def test_cached_pipelines_are_returned_as_copies(rest_store, mocker):
+    """Tests that modifying a returned pipeline doesn't affect the cache."""
+    pipeline = _create_pipeline()
+    mocker.patch.object(RestZenStore, "_get_resource", return_value=pipeline)
+
+    rest_store.get_pipeline(pipeline.id).name = "modified"
+
+    assert rest_store.get_pipeline(pipeline.id).name == "pipeline"
+    assert pipeline.name == "pipeline"
+
+
+def test_updating_or_deleting_pipeline_invalidates_cache(rest_store, mocker):
+    """Tests that updating or deleting a pipeline drops it from the cache."""
+    pipeline = _create_pipeline()
+    mock_get = mocker.patch.object(
+        RestZenStore, "_get_resource", return_value=pipeline
+    )
+    mocker.patch.object(RestZenStore, "_update_resource", return_value=pipeline)
+    mocker.patch.object(RestZenStore, "_delete_resource")
+
+    rest_store.get_pipeline(pipeline.id)
+    rest_store.update_pipeline(pipeline)
+    rest_store.get_pipeline(pipeline.id)
+    assert mock_get.call_count == 2
+
+    rest_store.delete_pipeline(pipeline.id)
+    rest_store.get_pipeline(pipeline.id)
+    assert mock_get.call_count == 3
+
+
+def test_pipeline_cache_is_bounded(rest_store, mocker):
+    """Tests that the pipeline cache is bounded by `PIPELINE_CACHE_MAXSIZE`."""
+    mocker.patch.object(rest_zen_store, "PIPELINE_CACHE_MAXSIZE", 2)
+    pipelines = {
+        pipeline.id: pipeline
+        for pipeline in (_create_pipeline() for _ in range(3))
+    }
+    mocker.patch.object(
+        RestZenStore,
+        "_get_resource",
+        side_effect=lambda resource_id, **kwargs: pipelines[resource_id],
+    )
+
+    for pipeline_id in pipelines:
+        rest_store.get_pipeline(pipeline_id)
+
+    assert list(rest_store._pipeline_cache) == list(pipelines)[1:]
+
+
+def _create_flavor() -> FlavorModel:
+    """Creates a flavor model."""
+    return FlavorModel(
+        name="flavor",
+        type=StackComponentType.ORCHESTRATOR,
+        config_schema="{}",
+        source="module.Flavor",
+        user=uuid4(),
+        project=uuid4(),
+    )
+
+
+def test_flavor_listings_are_cached_until_they_expire(rest_store, mocker):
+    """Tests that flavors are listed again once their cache entry expired."""
+    flavor = _create_flavor()
+    mock_list = mocker.patch.object(
+        RestZenStore, "_list_resources", return_value=[flavor]
+    )
+    mock_time = mocker.patch("time.time", return_value=1000.0)
+
+    assert rest_store.list_flavors() == [flavor]
+    mock_time.return_value += rest_zen_store.FLAVOR_CACHE_TTL - 1
+    assert rest_store.list_flavors() == [flavor]
+    assert mock_list.call_count == 1
+
+    # listings with different filters are cached separately
+    rest_store.list_flavors(name="flavor")
+    assert mock_list.call_count == 2
+
+    mock_time.return_value += 1
+    rest_store.list_flavors()
+    assert mock_list.call_count == 3
+
+
+def test_cached_flavors_are_returned_as_copies(rest_store, mocker):
+    """Tests that modifying listed flavors doesn't affect the cache."""
+    flavor = _create_flavor()
+    mocker.patch.object(RestZenStore, "_list_resources", return_value=[flavor])
+
+    rest_store.list_flavors()[0].name = "modified"
+    rest_store.list_flavors()[0].name = "modified"
+
+    assert rest_store.list_flavors()[0].name == "flavor"
+    assert flavor.name == "flavor"
+
+
+def test_modifying_flavors_clears_flavor_cache(rest_store, mocker):
+    """Tests that creating, updating or deleting flavors clears the cache."""
+    flavor = _create_flavor()
+    mock_list = mocker.patch.object(
+        RestZenStore, "_list_resources", return_value=[flavor]
+    )
+    mocker.patch.object(
+        RestZenStore, "_create_project_scoped_resource", return_value=flavor
+    )
+    mocker.patch.object(RestZenStore, "_update_resource", return_value=flavor)
+    mocker.patch.object(RestZenStore, "_delete_resource")
+
+    rest_store.list_flavors()
+    rest_store.create_flavor(flavor)
+    rest_store.list_flavors()
+    assert mock_list.call_count == 2
+
+    rest_store.update_flavor(flavor)
+    rest_store.list_flavors()
+    assert mock_list.call_count == 3
+
+    rest_store.delete_flavor(flavor.id)
+    rest_store.list_flavors()
+    assert mock_list.call_count == 4
+
+
+def _create_response(status_code: int, body) -> requests.Response:
+    """Creates a response with the given status code and JSON or raw body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "http://localhost:8080/api/v1/resource"
+    response.encoding = "utf-8"
+    response._content = (
+        body if isinstance(body, bytes) else json.dumps(body).encode()
+    )
+    return response
+
+
+def test_successful_responses_are_parsed(rest_store):
+    """Tests that the body of successful responses is returned."""
+    response = _create_response(200, {"name": "resource"})
+    assert rest_store._handle_response(response) == {"name": "resource"}
+
+    with pytest.raises(ValueError):
+        rest_store._handle_response(_create_response(200, b"<html></html>"))
+
+
+@pytest.mark.parametrize(
+    "status_code, detail, error",
+    [
+        (401, ["Unauthorized"], AuthorizationException),
+        (404, ["KeyError", "Unable to find resource"], KeyError),
+        (404, ["DoesNotExistException", "No resource"], DoesNotExistException),
+        (404, "Not Found", DoesNotExistException),
+        (
+            409,
+            ["StackComponentExistsError", "Exists"],
+            StackComponentExistsError,
+        ),
+        (409, ["StackExistsError", "Exists"], StackExistsError),
+        (409, ["EntityExistsError", "Exists"], EntityExistsError),
+        (409, ["IllegalOperationError", "Conflict"], ValueError),
+        (422, ["ValueError", "Invalid value"], RuntimeError),
+        (500, ["RuntimeError", "Failure"], RuntimeError),
+        (418, ["I'm a teapot"], RuntimeError),
+    ],
+)
+def test_error_responses_raise_matching_exceptions(
+    rest_store, status_code, detail, error
+):
+    """Tests that error responses are translated into exceptions."""
+    response = _create_response(status_code, {"detail": detail})
+    with pytest.raises(error):
+        rest_store._handle_response(response)
+
+
+def test_error_messages_include_server_details(rest_store):
+    """Tests that the error details reported by the server are kept."""
+    response = _create_response(
+        404, {"detail": ["DoesNotExistException", "No stack with ID 'x'"]}
+    )
+    with pytest.raises(DoesNotExistException, match="No stack with ID 'x'"):
+        rest_store._handle_response(response)
+
+    response = _create_response(404, {"detail": ["KeyError", "No user 'x'"]})
+    with pytest.raises(KeyError, match="No user 'x'"):
+        rest_store._handle_response(response)
+
+
+def test_validation_errors_are_formatted(rest_store):
+    """Tests that request validation errors reported by FastAPI are readable."""
+    response = _create_response(
+        422,
+        {
+            "detail": [
+                {
+                    "loc": ["body", "name"],
+                    "msg": "field required",
+                    "type": "value_error.missing",
+                }
+            ]
+        },
+    )
+    with pytest.raises(RuntimeError, match="body.name: field required"):
+        rest_store._handle_response(response)
+
+
+@pytest.mark.parametrize(
+    "status_code, error",
+    [
+        (404, DoesNotExistException),
+        (409, ValueError),
+        (422, RuntimeError),
+        (500, RuntimeError),
+    ],
+)
+def test_non_json_error_responses_raise_exceptions(
+    rest_store, status_code, error
+):
+    """Tests that error responses without a JSON body are handled."""
+    response = _create_response(status_code, b"Bad Gateway")
+    with pytest.raises(error):
+        rest_store._handle_response(response)
+
+
+def test_unexpected_error_responses_include_the_body(rest_store):
+    """Tests that errors with unknown status codes report the response."""
+    response = _create_response(503, b"Service Unavailable")
+    with pytest.raises(RuntimeError) as e:
+        rest_store._handle_response(response)
+
+    assert "503" in str(e.value)
+    assert "Service Unavailable" in str(e.value)
+
+
+def test_expiring_auth_tokens_are_replaced(rest_store, mocker):
+    """Tests that the session is authenticated again before a token expires."""
+    tokens = iter(["first", "second"])
+
+    def _get_auth_token() -> str:
+        rest_store._api_token = next(tokens)
+        rest_store._api_token_expiration = 1000.0
+        return rest_store._api_token
+
+    mocker.patch.object(
+        RestZenStore, "_get_auth_token", side_effect=_get_auth_token
+    )
+    mock_time = mocker.patch("time.time", return_value=900.0)
+
+    session = rest_store.session
+    assert session.headers["Authorization"] == "Bearer first"
+    assert rest_store.session.headers["Authorization"] == "Bearer first"
+
+    mock_time.return_value = (
+        1000.0 - rest_zen_store.AUTH_TOKEN_EXPIRATION_MARGIN
+    )
+    assert rest_store.session is session
+    assert session.headers["Authorization"] == "Bearer first"
+
+    mock_time.return_value += 1
+    assert rest_store.session is session
+    assert session.headers["Authorization"] == "Bearer second"
+
+
+def test_read_timeouts_are_not_retried(rest_store):
+    """Tests that read timeouts are raised without sending the request again."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    connections = []
+
+    def _accept_without_responding() -> None:
+        while True:
+            try:
+                connection, _ = server.accept()
+            except OSError:
+                return
+            connections.append(connection)
+
+    threading.Thread(target=_accept_without_responding, daemon=True).start()
+    host, port = server.getsockname()
+    session = rest_store._create_session()
+    try:
+        with pytest.raises(requests.ReadTimeout):
+            session.get(f"http://{host}:{port}/", timeout=0.2)
+    finally:
+        server.close()
+        for connection in connections:
+            connection.close()
+
+    assert len(connections) == 1
+
+
+def test_flavor_listings_are_cached_per_filter_value(rest_store, mocker):
+    """Tests that filter values which only look alike are cached separately."""
+    mock_list = mocker.patch.object(
+        RestZenStore, "_list_resources", return_value=[_create_flavor()]
+    )
+
+    rest_store.list_flavors()
+    rest_store.list_flavors(name="None")
+    rest_store.list_flavors(is_shared=True)
+    rest_store.list_flavors(name="True")
+    assert mock_list.call_count == 4
+
+    rest_store.list_flavors(name="None")
+    assert mock_list.call_count == 4
+    assert mock_list.call_args_list[1][1]["name"] == "None"
@@ -22,6 +22,7 @@ from zenml.config.pipeline_configurations import PipelineSpec
 from zenml.enums import ExecutionStatus, StackComponentType
 from zenml.exceptions import (
     EntityExistsError,
+    IllegalOperationError,
     StackComponentExistsError,
     StackExistsError,
 )
@@ -1343,10 +1344,11 @@ def test_get_flavor_succeeds(
             )[0]
             .id
         )
-        assert (
-            sql_store["store"].get_flavor(flavor_id=verata_flavor_id).name
-            == flavor_name
+        verata_flavor = sql_store["store"].get_flavor(
+            flavor_id=verata_flavor_id
         )
+        assert verata_flavor.name == flavor_name
+        assert verata_flavor.type is StackComponentType.ARTIFACT_STORE
 
 
 def test_get_flavor_fails_when_flavor_does_not_exist(
@@ -1357,6 +1359,80 @@ def test_get_flavor_fails_when_flavor_does_not_exist(
         sql_store["store"].get_flavor(flavor_id=uuid.uuid4())
 
 
+def test_updating_flavor_succeeds(
+    sql_store: BaseZenStore,
+):
+    """Tests updating stack component flavor."""
+    flavor_name = "aparecium"
+    aparecium_flavor = FlavorModel(
+        name=flavor_name,
+        type=StackComponentType.ARTIFACT_STORE,
+        config_schema="default",
+        source=".",
+        project=sql_store["default_project"].id,
+        user=sql_store["active_user"].id,
+    )
+    created_flavor = sql_store["store"].create_flavor(flavor=aparecium_flavor)
+    created_flavor.source = "updated.source"
+    updated_flavor = sql_store["store"].update_flavor(flavor=created_flavor)
+    assert updated_flavor.source == "updated.source"
+    assert (
+        sql_store["store"].get_flavor(flavor_id=created_flavor.id).source
+        == "updated.source"
+    )
+
+
+def test_renaming_flavor_fails_when_name_is_taken(
+    sql_store: BaseZenStore,
+):
+    """Tests renaming a flavor to the name of an existing flavor fails."""
+    flavor_kwargs = dict(
+        type=StackComponentType.ARTIFACT_STORE,
+        config_schema="default",
+        source=".",
+        project=sql_store["default_project"].id,
+        user=sql_store["active_user"].id,
+    )
+    sql_store["store"].create_flavor(
+        flavor=FlavorModel(name="accio", **flavor_kwargs)
+    )
+    renamed_flavor = sql_store["store"].create_flavor(
+        flavor=FlavorModel(name="lumos", **flavor_kwargs)
+    )
+    renamed_flavor.name = "accio"
+    with pytest.raises(EntityExistsError):
+        sql_store["store"].update_flavor(flavor=renamed_flavor)
+
+
+def test_renaming_flavor_fails_when_flavor_is_used(
+    sql_store: BaseZenStore,
+):
+    """Tests renaming a flavor that is used by stack components fails."""
+    flavor = sql_store["store"].create_flavor(
+        flavor=FlavorModel(
+            name="nox",
+            type=StackComponentType.ORCHESTRATOR,
+            config_schema="default",
+            source=".",
+            project=sql_store["default_project"].id,
+            user=sql_store["active_user"].id,
+        )
+    )
+    sql_store["store"].create_stack_component(
+        component=ComponentModel(
+            name="nox_orchestrator",
+            type=StackComponentType.ORCHESTRATOR,
+            flavor="nox",
+            configuration={},
+            project=sql_store["default_project"].id,
+            user=sql_store["active_user"].id,
+        )
+    )
+    flavor.name = "incendio"
+    with pytest.raises(IllegalOperationError):
+        sql_store["store"].update_flavor(flavor=flavor)
+
+
 def test_list_flavors_succeeds(
     sql_store: BaseZenStore,
 ):